@@ -1,16 +1,28 @@
 #!/usr/bin/env python3
 import argparse
 import json
+import math
+import mmap
+import os
 import re
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from statistics import mean
 
+try:
+    import orjson  # C serializer, optional
+except ImportError:
+    orjson = None
+
+# Possessive quantifiers (Python 3.11+) keep matching time bounded on
+# truncated or corrupt lines: a numeric field never gives characters back,
+# so the optional tails fail fast instead of backtracking through them.
 SENDER_RE = re.compile(
-    r"stats frame=(?P<frame_ms>\d+)ms tx=(?P<tx_pps>\d+)pps (?P<kbps>[\d.]+)kbps "
-    r"cap=(?P<cap_chunks>\d+)chunks/s (?P<cap_samples>\d+)samples/s "
-    r"drop=(?P<drop>\d+) q=(?P<queue>\d+)"
-    r"(?: avgAbs=(?P<avg_abs>[\d.]+) active=(?P<active_pct>[\d.]+)%)?"
-    r"(?: perf capQ=(?P<capq_ms>[\d.]+)ms capSend=(?P<capsend_ms>[\d.]+)ms pkt=(?P<pkt_ms>[\d.]+)ms sock=(?P<sock_ms>[\d.]+)ms)?"
+    r"stats frame=(?P<frame_ms>\d++)ms tx=(?P<tx_pps>\d++)pps (?P<kbps>[\d.]++)kbps "
+    r"cap=(?P<cap_chunks>\d++)chunks/s (?P<cap_samples>\d++)samples/s "
+    r"drop=(?P<drop>\d++) q=(?P<queue>\d++)"
+    r"(?: avgAbs=(?P<avg_abs>[\d.]++) active=(?P<active_pct>[\d.]++)%)?"
+    r"(?: perf capQ=(?P<capq_ms>[\d.]++)ms capSend=(?P<capsend_ms>[\d.]++)ms pkt=(?P<pkt_ms>[\d.]++)ms sock=(?P<sock_ms>[\d.]++)ms)?"
 )
 
 RECEIVER_RE = re.compile(
@@ -28,20 +40,77 @@ RECEIVER_PERF_RE = re.compile(
 
 INIT_RE = re.compile(r"frameMs=(?P<frame_ms>\d+)\s+targetFrames=(?P<target_frames>\d+)")
 
+# Stats and perf lines are collected in one alternation so the receiver
+# log is scanned once instead of twice; the first group tells which
+# branch matched. Group names of the two patterns do not overlap.
+RECEIVER_COMBINED_RE = re.compile(RECEIVER_RE.pattern + "|" + RECEIVER_PERF_RE.pattern)
+
+
+def _bytes_twin(pattern):
+    # The patterns are pure ASCII, so the bytes variant is a straight re-encode.
+    return re.compile(pattern.pattern.encode("ascii"))
+
+
+# Bytes twins used to match memory-mapped logs without decoding them.
+SENDER_RE_B = _bytes_twin(SENDER_RE)
+RECEIVER_COMBINED_RE_B = _bytes_twin(RECEIVER_COMBINED_RE)
+INIT_RE_B = _bytes_twin(INIT_RE)
+
+# Column order matches the capture-group order of the patterns above.
+SENDER_FIELDS = (
+    "frame_ms",
+    "tx_pps",
+    "kbps",
+    "cap_chunks",
+    "cap_samples",
+    "drop",
+    "queue",
+    "avg_abs",
+    "active_pct",
+    "capq_ms",
+    "capsend_ms",
+    "pkt_ms",
+    "sock_ms",
+)
+RECEIVER_FIELDS = (
+    "rx_pps",
+    "kbps",
+    "delay_ms",
+    "buffer_ms",
+    "loss",
+    "late",
+    "over",
+    "underrun",
+    "parse_err",
+    "payload_err",
+)
+RECEIVER_PERF_FIELDS = (
+    "net_age_ms",
+    "net_path_ms",
+    "net_jit_ms",
+    "decode_ms",
+    "playout_ms",
+    "e2e_ms",
+)
+
 
-def safe_mean(values):
-    return mean(values) if values else 0.0
+def columnize(fields, rows):
+    """Transpose row tuples into one contiguous double array per field."""
+    if not rows:
+        return {name: array("d") for name in fields}
+    return {name: array("d", col) for name, col in zip(fields, zip(*rows))}
 
 
-def safe_mean_or_none(values):
-    vals = [v for v in values if v is not None]
-    return mean(vals) if vals else None
+def safe_mean(values):
+    # fsum keeps the accumulation exact without statistics.mean's
+    # Fraction arithmetic, which is overkill for display precision.
+    return math.fsum(values) / len(values) if len(values) else 0.0
 
 
-def parse_ms(value):
-    if value is None or value == "n/a":
-        return None
-    return float(value)
+def safe_mean_or_none(values):
+    # NaN marks fields that were absent or "n/a" in the log.
+    vals = [v for v in values if not math.isnan(v)]
+    return math.fsum(vals) / len(vals) if vals else None
 
 
 def fmt(value, digits=1):
@@ -50,86 +119,163 @@ def fmt(value, digits=1):
     return f"{value:.{digits}f}"
 
 
-def read_lines_auto(path: Path):
-    raw = path.read_bytes()
-    for enc in ("utf-8-sig", "utf-16", "utf-16-le", "cp1252", "latin-1"):
+def map_log(path: Path):
+    """Open a log for matching, avoiding a decode whenever possible.
+
+    BOM-less logs (the common case) are memory-mapped and returned as a
+    bytes buffer that the *_RE_B patterns match directly - the file is
+    paged in by the OS and never copied into a Python str. A BOM means
+    UTF-16 or UTF-8-sig (PowerShell redirection writes UTF-16), which the
+    bytes patterns cannot match, so those are decoded to str as before.
+    """
+    with open(path, "rb") as f:
         try:
-            text = raw.decode(enc)
-        except UnicodeDecodeError:
-            continue
-        # If decode produced mostly NUL chars, it's likely the wrong encoding.
-        if text and (text.count("\x00") / len(text)) > 0.1:
-            continue
-        return text.splitlines()
-    return raw.decode("utf-8", errors="ignore").splitlines()
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return b""  # empty file cannot be mapped
+    if buf[:3] == b"\xef\xbb\xbf":
+        enc = "utf-8-sig"
+    elif buf[:2] in (b"\xff\xfe", b"\xfe\xff"):
+        enc = "utf-16"
+    else:
+        return buf
+    try:
+        return buf[:].decode(enc, errors="ignore")
+    finally:
+        buf.close()
 
 
 def parse_sender(path: Path):
     rows = []
-    for line in read_lines_auto(path):
-        m = SENDER_RE.search(line)
-        if not m:
-            continue
-        rows.append(
-            {
-                "frame_ms": int(m.group("frame_ms")),
-                "tx_pps": int(m.group("tx_pps")),
-                "kbps": float(m.group("kbps")),
-                "cap_chunks": int(m.group("cap_chunks")),
-                "cap_samples": int(m.group("cap_samples")),
-                "drop": int(m.group("drop")),
-                "queue": int(m.group("queue")),
-                "avg_abs": float(m.group("avg_abs")) if m.group("avg_abs") is not None else None,
-                "active_pct": float(m.group("active_pct")) if m.group("active_pct") is not None else None,
-                "capq_ms": float(m.group("capq_ms")) if m.group("capq_ms") is not None else None,
-                "capsend_ms": float(m.group("capsend_ms")) if m.group("capsend_ms") is not None else None,
-                "pkt_ms": float(m.group("pkt_ms")) if m.group("pkt_ms") is not None else None,
-                "sock_ms": float(m.group("sock_ms")) if m.group("sock_ms") is not None else None,
-            }
+    # Bind hot lookups to locals so the loop avoids repeated attribute dispatch.
+    append = rows.append
+    buf = map_log(path)
+    if isinstance(buf, str):
+        sender_re = SENDER_RE
+        # The substring test runs at memchr speed and rejects files with
+        # no stats lines without ever starting the regex engine.
+        scan = "stats frame=" in buf
+    else:
+        sender_re = SENDER_RE_B
+        scan = buf.find(b"stats frame=") >= 0  # mmap has no substring `in`
+    # One finditer pass over the whole file keeps the matching inside the
+    # regex engine instead of crossing into Python once per line. Stats
+    # fields cannot match across a newline, so this is line-equivalent.
+    for m in sender_re.finditer(buf) if scan else ():
+        # One groups() call instead of a named lookup per field. int() and
+        # float() accept bytes, so groups are converted without an
+        # intermediate str on the mmap path.
+        (
+            frame_ms,
+            tx_pps,
+            kbps,
+            cap_chunks,
+            cap_samples,
+            drop,
+            queue,
+            avg_abs,
+            active_pct,
+            capq_ms,
+            capsend_ms,
+            pkt_ms,
+            sock_ms,
+        ) = m.groups()
+        append(
+            (
+                float(frame_ms),
+                float(tx_pps),
+                float(kbps),
+                float(cap_chunks),
+                float(cap_samples),
+                float(drop),
+                float(queue),
+                float(avg_abs) if avg_abs is not None else math.nan,
+                float(active_pct) if active_pct is not None else math.nan,
+                float(capq_ms) if capq_ms is not None else math.nan,
+                float(capsend_ms) if capsend_ms is not None else math.nan,
+                float(pkt_ms) if pkt_ms is not None else math.nan,
+                float(sock_ms) if sock_ms is not None else math.nan,
+            )
         )
-    return rows
+    if isinstance(buf, mmap.mmap):
+        buf.close()
+    return columnize(SENDER_FIELDS, rows)
 
 
 def parse_receiver(path: Path):
     rows = []
     perf_rows = []
     init = {"frame_ms": None, "target_frames": None}
-    text = "\n".join(read_lines_auto(path))
-
-    im = INIT_RE.search(text)
+    buf = map_log(path)
+    if isinstance(buf, str):
+        init_re, combined_re, na = INIT_RE, RECEIVER_COMBINED_RE, "n/a"
+        scan = "stats" in buf or "perf" in buf
+    else:
+        init_re, combined_re, na = INIT_RE_B, RECEIVER_COMBINED_RE_B, b"n/a"
+        scan = buf.find(b"stats") >= 0 or buf.find(b"perf") >= 0
+
+    im = init_re.search(buf)
     if im:
         init["frame_ms"] = int(im.group("frame_ms"))
         init["target_frames"] = int(im.group("target_frames"))
 
-    for m in RECEIVER_RE.finditer(text):
-        delay_raw = m.group("delay")
-        delay_ms = None if delay_raw == "n/a" else float(delay_raw)
-        rows.append(
-            {
-                "rx_pps": int(m.group("rx_pps")),
-                "kbps": float(m.group("kbps")),
-                "delay_ms": delay_ms,
-                "buffer_ms": int(m.group("buffer_ms")),
-                "loss": int(m.group("loss")),
-                "late": int(m.group("late")),
-                "over": int(m.group("over")),
-                "underrun": int(m.group("underrun")),
-                "parse_err": int(m.group("parse_err")),
-                "payload_err": int(m.group("payload_err")),
-            }
-        )
-    for m in RECEIVER_PERF_RE.finditer(text):
-        perf_rows.append(
-            {
-                "net_age_ms": parse_ms(m.group("net_age_ms")),
-                "net_path_ms": parse_ms(m.group("net_path_ms")),
-                "net_jit_ms": parse_ms(m.group("net_jit_ms")),
-                "decode_ms": parse_ms(m.group("decode_ms")),
-                "playout_ms": parse_ms(m.group("playout_ms")),
-                "e2e_ms": parse_ms(m.group("e2e_ms")),
-            }
-        )
-    return rows, init, perf_rows
+    append = rows.append
+    perf_append = perf_rows.append
+    # One pass over the file; the stats and perf alternatives fill
+    # disjoint group slices, so the first group says which one matched.
+    # The cheap substring prefilter above skips the scan outright for
+    # files that contain no stats or perf lines.
+    for m in combined_re.finditer(buf) if scan else ():
+        groups = m.groups()
+        if groups[0] is not None:
+            (
+                rx_pps,
+                kbps,
+                delay_raw,
+                buffer_ms,
+                loss,
+                late,
+                over,
+                underrun,
+                parse_err,
+                payload_err,
+            ) = groups[:10]
+            append(
+                (
+                    float(rx_pps),
+                    float(kbps),
+                    # The groups always match, so only the n/a sentinel
+                    # needs checking before the float conversion; NaN
+                    # flows into the nan-skipping averages downstream.
+                    float(delay_raw) if delay_raw != na else math.nan,
+                    float(buffer_ms),
+                    float(loss),
+                    float(late),
+                    float(over),
+                    float(underrun),
+                    float(parse_err),
+                    float(payload_err),
+                )
+            )
+        else:
+            net_age, net_path, net_jit, decode_ms, playout, e2e = groups[10:]
+            perf_append(
+                (
+                    float(net_age) if net_age != na else math.nan,
+                    float(net_path) if net_path != na else math.nan,
+                    float(net_jit) if net_jit != na else math.nan,
+                    float(decode_ms) if decode_ms != na else math.nan,
+                    float(playout) if playout != na else math.nan,
+                    float(e2e) if e2e != na else math.nan,
+                )
+            )
+    if isinstance(buf, mmap.mmap):
+        buf.close()
+    return (
+        columnize(RECEIVER_FIELDS, rows),
+        init,
+        columnize(RECEIVER_PERF_FIELDS, perf_rows),
+    )
 
 
 def latency_estimate_ms(summary):
@@ -142,120 +288,129 @@ def latency_estimate_ms(summary):
 
 
 def score_run(summary):
-    # Score 0..100, higher is better.
-    s = 100.0
-    recv_ps = summary["receiver"]["per_sec"]
-    sender_ps = summary["sender"]["per_sec"]
-
-    s -= recv_ps["underrun"] * 25.0
-    s -= recv_ps["loss"] * 18.0
-    s -= recv_ps["parse_err"] * 50.0
-    s -= recv_ps["payload_err"] * 40.0
-    s -= recv_ps["over"] * 2.0
-    s -= sender_ps["drop"] * 30.0
-
-    # Latency penalty for "sweet spot" search.
-    # Prefer low end-to-end latency, but avoid instability.
+    # Score 0..100, higher is better. Bind the nested dicts once; the
+    # arithmetic below then only touches locals.
+    receiver = summary["receiver"]
+    recv_ps = receiver["per_sec"]
+    recv_avg = receiver["avg"]
+    sender = summary["sender"]
+
+    s = (
+        100.0
+        - recv_ps["underrun"] * 25.0
+        - recv_ps["loss"] * 18.0
+        - recv_ps["parse_err"] * 50.0
+        - recv_ps["payload_err"] * 40.0
+        - recv_ps["over"] * 2.0
+        - sender["per_sec"]["drop"] * 30.0
+    )
+
+    # Latency penalty for "sweet spot" search: piecewise-linear, each
+    # bracket adding to the slope. Prefer low end-to-end latency, but
+    # avoid instability.
     latency_ms = latency_estimate_ms(summary)
     if latency_ms > 20:
         s -= (latency_ms - 20) * 0.60
-    if latency_ms > 35:
-        s -= (latency_ms - 35) * 0.90
-    if latency_ms > 60:
-        s -= (latency_ms - 60) * 1.30
+        if latency_ms > 35:
+            s -= (latency_ms - 35) * 0.90
+            if latency_ms > 60:
+                s -= (latency_ms - 60) * 1.30
 
-    net_jit = summary["receiver"]["avg"].get("net_jit_ms")
+    net_jit = recv_avg.get("net_jit_ms")
     if net_jit is not None and net_jit > 5:
         s -= (net_jit - 5) * 0.80
 
-    tx_pps = summary["sender"]["avg"]["tx_pps"]
-    rx_pps = summary["receiver"]["avg"]["rx_pps"]
-    pps_gap = abs(tx_pps - rx_pps)
-    s -= pps_gap * 0.25
+    s -= abs(sender["avg"]["tx_pps"] - recv_avg["rx_pps"]) * 0.25
 
     return max(0.0, min(100.0, s))
 
 
+def select_rows(cols, keep):
+    return {name: array("d", (col[i] for i in keep)) for name, col in cols.items()}
+
+
 def summarize_run(label: str, sender_path: Path, receiver_path: Path):
-    sender_rows = parse_sender(sender_path)
-    receiver_rows, init, receiver_perf_rows = parse_receiver(receiver_path)
+    sender_cols = parse_sender(sender_path)
+    receiver_cols, init, receiver_perf_cols = parse_receiver(receiver_path)
 
-    if not sender_rows:
+    if not len(sender_cols["tx_pps"]):
         raise ValueError(f"{label}: sender log has no parsable stats lines")
-    if not receiver_rows:
+    if not len(receiver_cols["rx_pps"]):
         raise ValueError(f"{label}: receiver log has no parsable stats lines")
 
     # Ignore warm-up rows where no audio is actually flowing yet.
-    sender_rows = [r for r in sender_rows if r["tx_pps"] > 0]
-    receiver_rows = [r for r in receiver_rows if r["rx_pps"] > 0]
-    if not sender_rows:
+    keep = [i for i, v in enumerate(sender_cols["tx_pps"]) if v > 0]
+    if not keep:
         raise ValueError(f"{label}: sender log only contains warm-up rows")
-    if not receiver_rows:
+    if len(keep) != len(sender_cols["tx_pps"]):
+        sender_cols = select_rows(sender_cols, keep)
+    keep = [i for i, v in enumerate(receiver_cols["rx_pps"]) if v > 0]
+    if not keep:
         raise ValueError(f"{label}: receiver log only contains warm-up rows")
+    if len(keep) != len(receiver_cols["rx_pps"]):
+        receiver_cols = select_rows(receiver_cols, keep)
 
     # Skip startup transients where buffers are still stabilizing.
-    if len(sender_rows) > 8:
-        sender_rows = sender_rows[2:]
-    if len(receiver_rows) > 8:
-        receiver_rows = receiver_rows[2:]
+    if len(sender_cols["tx_pps"]) > 8:
+        sender_cols = {name: col[2:] for name, col in sender_cols.items()}
+    if len(receiver_cols["rx_pps"]) > 8:
+        receiver_cols = {name: col[2:] for name, col in receiver_cols.items()}
+
+    n_sender = len(sender_cols["tx_pps"])
+    n_receiver = len(receiver_cols["rx_pps"])
+    n_perf = len(receiver_perf_cols["e2e_ms"])
+
+    # Sum each counter column once; totals and per_sec both derive from it.
+    drop_total = sum(sender_cols["drop"])
+    counter_totals = {
+        name: sum(receiver_cols[name])
+        for name in ("loss", "late", "over", "underrun", "parse_err", "payload_err")
+    }
 
     sender_summary = {
-        "samples": len(sender_rows),
+        "samples": n_sender,
         "avg": {
-            "tx_pps": safe_mean([r["tx_pps"] for r in sender_rows]),
-            "kbps": safe_mean([r["kbps"] for r in sender_rows]),
-            "queue": safe_mean([r["queue"] for r in sender_rows]),
-            "cap_chunks": safe_mean([r["cap_chunks"] for r in sender_rows]),
-            "cap_samples": safe_mean([r["cap_samples"] for r in sender_rows]),
-            "avg_abs": safe_mean_or_none([r["avg_abs"] for r in sender_rows]),
-            "active_pct": safe_mean_or_none([r["active_pct"] for r in sender_rows]),
-            "capq_ms": safe_mean_or_none([r["capq_ms"] for r in sender_rows]),
-            "capsend_ms": safe_mean_or_none([r["capsend_ms"] for r in sender_rows]),
-            "pkt_ms": safe_mean_or_none([r["pkt_ms"] for r in sender_rows]),
-            "sock_ms": safe_mean_or_none([r["sock_ms"] for r in sender_rows]),
+            "tx_pps": safe_mean(sender_cols["tx_pps"]),
+            "kbps": safe_mean(sender_cols["kbps"]),
+            "queue": safe_mean(sender_cols["queue"]),
+            "cap_chunks": safe_mean(sender_cols["cap_chunks"]),
+            "cap_samples": safe_mean(sender_cols["cap_samples"]),
+            "avg_abs": safe_mean_or_none(sender_cols["avg_abs"]),
+            "active_pct": safe_mean_or_none(sender_cols["active_pct"]),
+            "capq_ms": safe_mean_or_none(sender_cols["capq_ms"]),
+            "capsend_ms": safe_mean_or_none(sender_cols["capsend_ms"]),
+            "pkt_ms": safe_mean_or_none(sender_cols["pkt_ms"]),
+            "sock_ms": safe_mean_or_none(sender_cols["sock_ms"]),
         },
         "totals": {
-            "drop": sum(r["drop"] for r in sender_rows),
+            "drop": int(drop_total),
         },
         "per_sec": {
-            "drop": sum(r["drop"] for r in sender_rows) / max(1, len(sender_rows)),
+            "drop": drop_total / max(1, n_sender),
         },
-        "frame_ms": sender_rows[0]["frame_ms"],
+        "frame_ms": int(sender_cols["frame_ms"][0]),
     }
 
-    delays = [r["delay_ms"] for r in receiver_rows if r["delay_ms"] is not None]
     receiver_summary = {
-        "samples": len(receiver_rows),
+        "samples": n_receiver,
         "avg": {
-            "rx_pps": safe_mean([r["rx_pps"] for r in receiver_rows]),
-            "kbps": safe_mean([r["kbps"] for r in receiver_rows]),
-            "delay_ms": safe_mean_or_none(delays),
-            "buffer_ms": safe_mean([r["buffer_ms"] for r in receiver_rows]),
-            "net_age_ms": safe_mean_or_none([r["net_age_ms"] for r in receiver_perf_rows]),
-            "net_path_ms": safe_mean_or_none([r["net_path_ms"] for r in receiver_perf_rows]),
-            "net_jit_ms": safe_mean_or_none([r["net_jit_ms"] for r in receiver_perf_rows]),
-            "decode_ms": safe_mean_or_none([r["decode_ms"] for r in receiver_perf_rows]),
-            "playout_ms": safe_mean_or_none([r["playout_ms"] for r in receiver_perf_rows]),
-            "e2e_ms": safe_mean_or_none([r["e2e_ms"] for r in receiver_perf_rows]),
-        },
-        "totals": {
-            "loss": sum(r["loss"] for r in receiver_rows),
-            "late": sum(r["late"] for r in receiver_rows),
-            "over": sum(r["over"] for r in receiver_rows),
-            "underrun": sum(r["underrun"] for r in receiver_rows),
-            "parse_err": sum(r["parse_err"] for r in receiver_rows),
-            "payload_err": sum(r["payload_err"] for r in receiver_rows),
+            "rx_pps": safe_mean(receiver_cols["rx_pps"]),
+            "kbps": safe_mean(receiver_cols["kbps"]),
+            "delay_ms": safe_mean_or_none(receiver_cols["delay_ms"]),
+            "buffer_ms": safe_mean(receiver_cols["buffer_ms"]),
+            "net_age_ms": safe_mean_or_none(receiver_perf_cols["net_age_ms"]),
+            "net_path_ms": safe_mean_or_none(receiver_perf_cols["net_path_ms"]),
+            "net_jit_ms": safe_mean_or_none(receiver_perf_cols["net_jit_ms"]),
+            "decode_ms": safe_mean_or_none(receiver_perf_cols["decode_ms"]),
+            "playout_ms": safe_mean_or_none(receiver_perf_cols["playout_ms"]),
+            "e2e_ms": safe_mean_or_none(receiver_perf_cols["e2e_ms"]),
         },
+        "totals": {name: int(total) for name, total in counter_totals.items()},
         "per_sec": {
-            "loss": sum(r["loss"] for r in receiver_rows) / max(1, len(receiver_rows)),
-            "late": sum(r["late"] for r in receiver_rows) / max(1, len(receiver_rows)),
-            "over": sum(r["over"] for r in receiver_rows) / max(1, len(receiver_rows)),
-            "underrun": sum(r["underrun"] for r in receiver_rows) / max(1, len(receiver_rows)),
-            "parse_err": sum(r["parse_err"] for r in receiver_rows) / max(1, len(receiver_rows)),
-            "payload_err": sum(r["payload_err"] for r in receiver_rows) / max(1, len(receiver_rows)),
+            name: total / max(1, n_receiver) for name, total in counter_totals.items()
         },
         "init": init,
-        "perf_samples": len(receiver_perf_rows),
+        "perf_samples": n_perf,
     }
 
     summary = {
@@ -270,25 +425,115 @@ def summarize_run(label: str, sender_path: Path, receiver_path: Path):
     return summary
 
 
+CACHE_NAME = ".audio_report_cache.json"
+
+
+def run_fingerprint(sender_path: Path, receiver_path: Path):
+    """Identity of a run pair: mtime and size of both logs."""
+    s = sender_path.stat()
+    r = receiver_path.stat()
+    return [s.st_mtime_ns, s.st_size, r.st_mtime_ns, r.st_size]
+
+
+def load_cache(logs_dir: Path):
+    try:
+        with (logs_dir / CACHE_NAME).open(encoding="utf-8") as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(logs_dir: Path, cache):
+    try:
+        with (logs_dir / CACHE_NAME).open("w", encoding="utf-8") as fp:
+            json.dump(cache, fp)
+    except OSError:
+        pass  # a read-only logs dir just loses the speedup
+
+
 def find_runs(logs_dir: Path):
     sender = {}
     receiver = {}
 
-    for p in logs_dir.glob("sender_*.log"):
-        label = p.stem[len("sender_") :]
-        if label.endswith(".err"):
-            continue
-        sender[label] = p
-    for p in logs_dir.glob("receiver_*.log"):
-        label = p.stem[len("receiver_") :]
-        if label.endswith(".err"):
-            continue
-        receiver[label] = p
-
-    labels = sorted(set(sender.keys()) & set(receiver.keys()))
+    # One scandir pass over the directory instead of two pathlib globs;
+    # glob wraps every entry in a Path and can re-stat it, scandir works
+    # straight off the directory listing. A missing or non-directory path
+    # yields no runs, like glob did, so main can report it cleanly.
+    try:
+        entries = os.scandir(logs_dir)
+    except OSError:
+        return []
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if not name.endswith(".log") or name.endswith(".err.log"):
+                continue
+            if name.startswith("sender_"):
+                sender[name[len("sender_") : -len(".log")]] = Path(entry.path)
+            elif name.startswith("receiver_"):
+                receiver[name[len("receiver_") : -len(".log")]] = Path(entry.path)
+
+    labels = sorted(sender.keys() & receiver.keys())
     return [(label, sender[label], receiver[label]) for label in labels]
 
 
+ROW_TEMPLATE = (
+    "| {label} | {sweet_score:.1f} | {latency_est_ms:.1f} | {buffer_ms:.1f} "
+    "| {underrun} | {loss} | {parse_err} | {payload_err} |"
+)
+
+RUN_TEMPLATE = """### {label}
+
+- Score: {sweet_score:.1f}
+- Sender: tx_pps={tx_pps:.1f}, kbps={sender_kbps:.1f}, drop_total={drop_total}
+- Latencia estimada (score): {latency_est_ms:.1f} ms
+- Receiver: rx_pps={rx_pps:.1f}, kbps={receiver_kbps:.1f}, delay_ms={delay_ms}, buffer_ms={buffer_ms:.1f}
+- Perf receiver: netAge={net_age_ms} ms, netPath={net_path_ms} ms, netJit={net_jit_ms} ms, decode={decode_ms} ms, playout={playout_ms} ms, e2e={e2e_ms} ms
+- Perf sender: capQ={capq_ms} ms, capSend={capsend_ms} ms, pkt={pkt_ms} ms, sock={sock_ms} ms
+- Receiver totals: underrun={underrun}, loss={loss}, late={late}, over={over}, parseErr={parse_err}, payloadErr={payload_err}
+- Receiver por segundo: underrun={underrun_ps:.2f}, loss={loss_ps:.2f}, over={over_ps:.2f}
+"""
+
+
+def flatten_run(run):
+    """Pre-flatten a run summary so each template formats in one call."""
+    sender_avg = run["sender"]["avg"]
+    recv_avg = run["receiver"]["avg"]
+    totals = run["receiver"]["totals"]
+    per_sec = run["receiver"]["per_sec"]
+    return {
+        "label": run["label"],
+        "sweet_score": run["sweet_score"],
+        "latency_est_ms": run["latency_est_ms"],
+        "tx_pps": sender_avg["tx_pps"],
+        "sender_kbps": sender_avg["kbps"],
+        "drop_total": run["sender"]["totals"]["drop"],
+        "rx_pps": recv_avg["rx_pps"],
+        "receiver_kbps": recv_avg["kbps"],
+        "delay_ms": fmt(recv_avg["delay_ms"]),
+        "buffer_ms": recv_avg["buffer_ms"],
+        "net_age_ms": fmt(recv_avg["net_age_ms"]),
+        "net_path_ms": fmt(recv_avg["net_path_ms"]),
+        "net_jit_ms": fmt(recv_avg["net_jit_ms"]),
+        "decode_ms": fmt(recv_avg["decode_ms"], 3),
+        "playout_ms": fmt(recv_avg["playout_ms"]),
+        "e2e_ms": fmt(recv_avg["e2e_ms"]),
+        "capq_ms": fmt(sender_avg["capq_ms"], 3),
+        "capsend_ms": fmt(sender_avg["capsend_ms"], 3),
+        "pkt_ms": fmt(sender_avg["pkt_ms"], 3),
+        "sock_ms": fmt(sender_avg["sock_ms"], 3),
+        "underrun": totals["underrun"],
+        "loss": totals["loss"],
+        "late": totals["late"],
+        "over": totals["over"],
+        "parse_err": totals["parse_err"],
+        "payload_err": totals["payload_err"],
+        "underrun_ps": per_sec["underrun"],
+        "loss_ps": per_sec["loss"],
+        "over_ps": per_sec["over"],
+    }
+
+
 def render_markdown(report):
     lines = []
     lines.append("# Audio Report")
@@ -302,52 +547,20 @@ def render_markdown(report):
         )
         lines.append("")
 
+    flats = [flatten_run(run) for run in report["runs"]]
+
     lines.append("## Ranking")
     lines.append("")
     lines.append("| Label | Score | Lat est ms | Avg Buffer ms | Underrun | Loss | ParseErr | PayloadErr |")
     lines.append("|---|---:|---:|---:|---:|---:|---:|---:|")
-    for run in report["runs"]:
-        lines.append(
-            "| {label} | {score:.1f} | {lat:.1f} | {buffer:.1f} | {underrun} | {loss} | {parse} | {payload} |".format(
-                label=run["label"],
-                score=run["sweet_score"],
-                lat=run["latency_est_ms"],
-                buffer=run["receiver"]["avg"]["buffer_ms"],
-                underrun=run["receiver"]["totals"]["underrun"],
-                loss=run["receiver"]["totals"]["loss"],
-                parse=run["receiver"]["totals"]["parse_err"],
-                payload=run["receiver"]["totals"]["payload_err"],
-            )
-        )
+    for flat in flats:
+        lines.append(ROW_TEMPLATE.format_map(flat))
     lines.append("")
     lines.append("## Detalle por run")
     lines.append("")
-    for run in report["runs"]:
-        lines.append(f"### {run['label']}")
-        lines.append("")
-        lines.append(f"- Score: {run['sweet_score']:.1f}")
-        lines.append(
-            f"- Sender: tx_pps={run['sender']['avg']['tx_pps']:.1f}, kbps={run['sender']['avg']['kbps']:.1f}, drop_total={run['sender']['totals']['drop']}"
-        )
-        lines.append(
-            f"- Latencia estimada (score): {run['latency_est_ms']:.1f} ms"
-        )
-        lines.append(
-            f"- Receiver: rx_pps={run['receiver']['avg']['rx_pps']:.1f}, kbps={run['receiver']['avg']['kbps']:.1f}, delay_ms={fmt(run['receiver']['avg']['delay_ms'])}, buffer_ms={run['receiver']['avg']['buffer_ms']:.1f}"
-        )
-        lines.append(
-            f"- Perf receiver: netAge={fmt(run['receiver']['avg']['net_age_ms'])} ms, netPath={fmt(run['receiver']['avg']['net_path_ms'])} ms, netJit={fmt(run['receiver']['avg']['net_jit_ms'])} ms, decode={fmt(run['receiver']['avg']['decode_ms'], 3)} ms, playout={fmt(run['receiver']['avg']['playout_ms'])} ms, e2e={fmt(run['receiver']['avg']['e2e_ms'])} ms"
-        )
-        lines.append(
-            f"- Perf sender: capQ={fmt(run['sender']['avg']['capq_ms'], 3)} ms, capSend={fmt(run['sender']['avg']['capsend_ms'], 3)} ms, pkt={fmt(run['sender']['avg']['pkt_ms'], 3)} ms, sock={fmt(run['sender']['avg']['sock_ms'], 3)} ms"
-        )
-        lines.append(
-            f"- Receiver totals: underrun={run['receiver']['totals']['underrun']}, loss={run['receiver']['totals']['loss']}, late={run['receiver']['totals']['late']}, over={run['receiver']['totals']['over']}, parseErr={run['receiver']['totals']['parse_err']}, payloadErr={run['receiver']['totals']['payload_err']}"
-        )
-        lines.append(
-            f"- Receiver por segundo: underrun={run['receiver']['per_sec']['underrun']:.2f}, loss={run['receiver']['per_sec']['loss']:.2f}, over={run['receiver']['per_sec']['over']:.2f}"
-        )
-        lines.append("")
+    # One format_map per run instead of ten separate f-string appends.
+    for flat in flats:
+        lines.append(RUN_TEMPLATE.format_map(flat))
     return "\n".join(lines)
 
 
@@ -383,20 +596,60 @@ def main():
 
     summaries = []
     errors = []
+    # Unchanged log pairs are served from the on-disk cache so iterative
+    # tuning sessions only re-parse what actually changed.
+    cache = load_cache(args.logs_dir)
+    new_cache = {}
+    pending = []
     for label, sender_path, receiver_path in runs:
-        try:
-            summaries.append(summarize_run(label, sender_path, receiver_path))
-        except Exception as exc:
-            errors.append({"label": label, "error": str(exc)})
-
-    summaries.sort(
-        key=lambda r: (
-            -r["sweet_score"],
-            r["latency_est_ms"],
-            r["receiver"]["totals"]["underrun"],
-            r["receiver"]["totals"]["loss"],
+        fingerprint = run_fingerprint(sender_path, receiver_path)
+        entry = cache.get(label)
+        if entry and entry.get("fingerprint") == fingerprint:
+            summaries.append(entry["summary"])
+            new_cache[label] = entry
+        else:
+            pending.append((label, sender_path, receiver_path, fingerprint))
+
+    # Each remaining run is an independent parse + reduce, so fan them out
+    # across processes; the sort below restores a deterministic order.
+    if pending:
+        with ProcessPoolExecutor() as executor:
+            futures = {
+                executor.submit(summarize_run, label, sender_path, receiver_path): (
+                    label,
+                    fingerprint,
+                )
+                for label, sender_path, receiver_path, fingerprint in pending
+            }
+            for future in as_completed(futures):
+                label, fingerprint = futures[future]
+                try:
+                    summary = future.result()
+                except Exception as exc:
+                    errors.append({"label": label, "error": str(exc)})
+                else:
+                    summaries.append(summary)
+                    new_cache[label] = {"fingerprint": fingerprint, "summary": summary}
+    errors.sort(key=lambda e: e["label"])
+    save_cache(args.logs_dir, new_cache)
+
+    # Decorate-sort-undecorate: precomputed key tuples compare in C with
+    # no per-comparison lambda call. The unique label breaks ties
+    # deterministically (workers finish in arbitrary order) and stops the
+    # sort from ever comparing two summary dicts.
+    keyed = [
+        (
+            -summary["sweet_score"],
+            summary["latency_est_ms"],
+            summary["receiver"]["totals"]["underrun"],
+            summary["receiver"]["totals"]["loss"],
+            summary["label"],
+            summary,
         )
-    )
+        for summary in summaries
+    ]
+    keyed.sort()
+    summaries = [entry[-1] for entry in keyed]
 
     report = {
         "runs": summaries,
@@ -406,7 +659,12 @@ def main():
 
     args.out_json.parent.mkdir(parents=True, exist_ok=True)
     args.out_md.parent.mkdir(parents=True, exist_ok=True)
-    args.out_json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if orjson is not None:
+        args.out_json.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        # json.dump streams into the file instead of building one big str.
+        with args.out_json.open("w", encoding="utf-8") as fp:
+            json.dump(report, fp, indent=2)
     args.out_md.write_text(render_markdown(report), encoding="utf-8")
 
     print(f"Analisis completado. JSON: {args.out_json}")